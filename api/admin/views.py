@@ -18,7 +18,7 @@ from wtforms import BooleanField
 from wtforms.widgets import TextArea
 
 from markupsafe import Markup
-from sqlalchemy import or_
+from sqlalchemy import or_, func
 
 from .validators import (
     is_valid_date,
@@ -55,6 +55,8 @@ from .model_handler import PrinterModelChangeHandler
 from api.config import settings
 from api.crud import get_user, get_address, get_patents, get_printer
 from api.database import session
+from api.loaders import BatchLoader
+from api.api_utils import normalize_sort_key
 from api.admin.views_dir.utils import prefix_name
 from api.admin.views_dir.loaders import GenericAjaxModelLoader
 
@@ -624,40 +626,34 @@ class PrinterView(GlobalModelView):
 
     def get_list(self, page, sort_field, sort_desc, search, filters, page_size=None):
         query = self.session.query(self.model)
-        all_rows = query.all()
 
         if search:
-            normalized_search = unidecode(search).lower().strip()
-            search_tokens = normalized_search.split()
-
-            def match(row):
-                combined = f"{row.lastname or ''}"
-                normalized_combined = unidecode(combined).lower()
-                return all(token in normalized_combined for token in search_tokens)
-
-            filtered_rows = list(filter(match, all_rows))
-        else:
-            filtered_rows = all_rows
+            # match on the stored, accent-folded sort key instead of
+            # normalizing every row in Python
+            for token in normalize_sort_key(search).split():
+                query = query.filter(
+                    Person.lastname_sort.contains(token, autoescape=True)
+                )
 
-        count = len(filtered_rows)
+        count = query.count()
 
         # Optional sorting
-        if sort_field:
-            reverse = sort_desc
-            filtered_rows.sort(
-                key=lambda x: (
-                    getattr(x, sort_field, "").lower() if getattr(x, sort_field) else ""
-                ),
-                reverse=reverse,
+        if sort_field == "lastname":
+            query = query.order_by(
+                Person.lastname_sort.desc() if sort_desc else Person.lastname_sort,
+                Person.id.desc() if sort_desc else Person.id,
+            )
+        elif sort_field and hasattr(self.model, sort_field):
+            column = getattr(self.model, sort_field)
+            query = query.order_by(
+                func.lower(column).desc() if sort_desc else func.lower(column)
             )
 
         # Pagination
         if page_size:
-            start = page * page_size
-            end = start + page_size
-            filtered_rows = filtered_rows[start:end]
+            query = query.offset(page * page_size).limit(page_size)
 
-        return count, filtered_rows
+        return count, query.all()
 
     # Expose custom routes for printer view
     # for Ajax requests
@@ -714,11 +710,13 @@ class PrinterView(GlobalModelView):
             session.query(Person)
             .filter(
                 or_(
-                    Person.lastname.ilike(f"%{search.lower()}%"),
+                    Person.lastname_sort.contains(
+                        normalize_sort_key(search), autoescape=True
+                    ),
                     Person.firstnames.ilike(f"%{search.lower()}%"),
                 )
             )
-            .order_by(Person.lastname, Person.firstnames)
+            .order_by(Person.lastname_sort, Person.firstnames)
         ).limit(20)
 
         results = [{"id": person.id, "text": repr(person)} for person in query]
@@ -752,16 +750,16 @@ class PrinterView(GlobalModelView):
         """Retrieves relations for a printer."""
         patents = session.query(Patent).filter_by(person_id=person_id).all()
         patents_id = [p.id for p in patents]
+        relations_by_patent = BatchLoader(session).load_many(
+            PatentHasRelations.patent_id, patents_id
+        )
         grouped_relations = {}
         for pid in patents_id:
-            relations = (
-                session.query(PatentHasRelations)
-                .filter(
-                    PatentHasRelations.person_id == person_id,
-                    PatentHasRelations.patent_id == pid,
-                )
-                .all()
-            )
+            relations = [
+                relation
+                for relation in relations_by_patent[pid]
+                if relation.person_id == person_id
+            ]
             if pid not in grouped_relations:
                 grouped_relations[pid] = []
             for relation in relations:
@@ -779,13 +777,12 @@ class PrinterView(GlobalModelView):
         """Retrieves professional addresses for a printer."""
         patents = session.query(Patent).filter_by(person_id=person_id).all()
         patents_id = [p.id for p in patents]
+        addresses_by_patent = BatchLoader(session).load_many(
+            PatentHasAddresses.patent_id, patents_id
+        )
         grouped_addresses = {}
         for pid in patents_id:
-            addresses = (
-                session.query(PatentHasAddresses)
-                .filter(PatentHasAddresses.patent_id == pid)
-                .all()
-            )
+            addresses = addresses_by_patent[pid]
             if pid not in grouped_addresses:
                 grouped_addresses[pid] = []
             for address in addresses:
@@ -5,9 +5,13 @@ Utility functions for the API.
 """
 
 from typing import Union
+import base64
 import calendar
+import json
 import re
 
+from unidecode import unidecode
+
 _COMMA_FIX = re.compile(r"\s*,+\s*")
 _MULTI_SPACE = re.compile(r"\s{2,}")
 
@@ -42,6 +46,25 @@ def normalize_firstnames(v: str) -> str:
     return s
 
 
+def normalize_sort_key(v: str) -> str:
+    """Normalize a label to an accent-folded, lowercased sort key.
+
+    Examples:
+    >>> normalize_sort_key("  Émond ")
+    'emond'
+    >>> normalize_sort_key("Lœillot")
+    'loeillot'
+    >>> normalize_sort_key(None)
+    ''
+
+    :param v: The input string to normalize.
+    :type v: str | None
+    :return: The normalized sort key.
+    :rtype: str
+    """
+    return unidecode(v or "").lower().strip()
+
+
 def normalize_date(date_str: str) -> str:
     """Normalize date strings to 'YYYY-MM-DD' format.
     Handles partial dates and removes approximation symbols.
@@ -114,3 +137,40 @@ def period_bounds(s: str) -> Union[tuple[str, str], tuple[None, None]]:
         y = int(s[:4])
         return f"{y:04d}-01-01", f"{y:04d}-12-31"
     return None, None
+
+
+def encode_cursor(direction: str, values: Union[list, tuple]) -> str:
+    """Encode a keyset pagination position as an opaque, URL-safe cursor.
+
+    Examples:
+    >>> decode_cursor(encode_cursor("next", ("dupont", 12)))
+    ('next', ['dupont', 12])
+
+    :param direction: The direction to follow from the position ('next' or 'prev').
+    :type direction: str
+    :param values: The values of the sort columns at the position (e.g. sort key and id).
+    :type values: list | tuple
+    :return: The opaque cursor.
+    :rtype: str
+    """
+    raw = json.dumps([direction, list(values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, list]:
+    """Decode a cursor built with `encode_cursor`.
+
+    :param cursor: The opaque cursor.
+    :type cursor: str
+    :return: A tuple (direction, values).
+    :rtype: tuple[str, list]
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return direction, values
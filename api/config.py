@@ -63,6 +63,16 @@ class Settings(BaseSettings):
     # ~ Database settings ~
     DB_URI: str = str(os.environ.get("DB_URI", "db/DIL.db"))
     DB_ECHO: bool = bool(os.environ.get("DB_ECHO", False))
+    # SQLite connection profile (PRAGMA applied on each new connection, empty to skip)
+    DB_JOURNAL_MODE: str = str(os.environ.get("DB_JOURNAL_MODE", "WAL"))
+    DB_SYNCHRONOUS: str = str(os.environ.get("DB_SYNCHRONOUS", "NORMAL"))
+    DB_TEMP_STORE: str = str(os.environ.get("DB_TEMP_STORE", "MEMORY"))
+    # in bytes (256 MiB)
+    DB_MMAP_SIZE: int = int(os.environ.get("DB_MMAP_SIZE", 268435456))
+    # negative values are in KiB (64 MiB)
+    DB_CACHE_SIZE: int = int(os.environ.get("DB_CACHE_SIZE", -65536))
+    # serve the API read routes with a separate read-only (mode=ro) engine
+    DB_READ_ONLY_API: bool = bool(os.environ.get("DB_READ_ONLY_API", True))
 
     # ~ Index settings ~
     WHOOSH_INDEX_DIR: str = str(os.environ.get("WHOOSH_INDEX_DIR", "index_dil"))
@@ -9,14 +9,27 @@ Reusable functions to interact with the data in the database.
 from typing import Type, Union
 import re
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 import bleach
 
 
-from .models.models import User, Person, Patent, City, Address, Image
+from .models.models import (
+    User,
+    Person,
+    Patent,
+    City,
+    Address,
+    Image,
+    PatentHasAddresses,
+    PatentHasRelations,
+    PersonHasAddresses,
+)
 from .models.constants import type_patent_relations
 from api.api_utils import normalize_firstnames
+from api.loaders import BatchLoader
+from api.lookup_cache import city_lookup
 
 MARKUP_HTML_FIELDS = {"personal_information", "professional_information"}
 inverted_type_relations = {v: k for k, v in type_patent_relations.items()}
@@ -53,6 +66,44 @@ def clean_html_markup(html_markup: str) -> Union[str, None]:
         return None
 
 
+def patent_detail_options() -> tuple:
+    """Loader options to fetch a patent with everything needed by `enhance_patent_response`.
+
+    Collections are loaded with `selectinload` (one extra query per collection, whatever
+    the number of rows) and many-to-one relations are joined, so no lazy load is triggered
+    while the response is built. City ids are resolved with the in-memory city lookup.
+
+    :return: A tuple of SQLAlchemy loader options to apply on a Patent query.
+    :rtype: tuple
+    """
+    return (
+        selectinload(Patent.addresses_relations).joinedload(
+            PatentHasAddresses.address_patents
+        ),
+        selectinload(Patent.patent_relations).joinedload(
+            PatentHasRelations.person_related
+        ),
+    )
+
+
+def printer_detail_options() -> tuple:
+    """Loader options to fetch a printer with everything needed by `enhance_printer_response`.
+
+    The whole `PrinterOut` payload is built in a fixed number of queries (person, personal
+    addresses, patents, patents addresses and patents relations) no matter how many
+    patents the printer has.
+
+    :return: A tuple of SQLAlchemy loader options to apply on a Person query.
+    :rtype: tuple
+    """
+    return (
+        selectinload(Person.addresses_relations).joinedload(
+            PersonHasAddresses.address_persons
+        ),
+        selectinload(Person.patents).options(*patent_detail_options()),
+    )
+
+
 def enhance_patent_response(
     db: Session, patent: Type[Patent], html_markup: bool = False
 ) -> dict:
@@ -70,9 +121,7 @@ def enhance_patent_response(
     return {
         "_id_dil": str(patent._id_dil) if patent._id_dil else None,
         "city_label": patent.city_label,
-        "city_id": str(get_city(db, {"id": patent.__dict__["city_id"]})._id_dil)
-        if patent.__dict__["city_id"]
-        else None,
+        "city_id": city_lookup.get_id_dil(db, patent.city_id),
         "date_start": patent.date_start,
         "date_end": patent.date_end,
         "references": clean_html_markup(patent.references)
@@ -85,9 +134,7 @@ def enhance_patent_response(
                 else None,
                 "label": address.address_patents.label,
                 "city_label": address.address_patents.city_label,
-                "city_id": str(address.address_patents.city._id_dil)
-                if address.address_patents.city_id
-                else None,
+                "city_id": city_lookup.get_id_dil(db, address.address_patents.city_id),
                 "date_occupation": address.date_occupation,
             }
             for address in patent.addresses_relations
@@ -139,11 +186,7 @@ def enhance_printer_response(
         "firstnames": normalize_firstnames(printer.firstnames),
         "birth_date": printer.birth_date,
         "birth_city_label": printer.birth_city_label,
-        "birth_city_id": str(
-            get_city(db, {"id": printer.__dict__["birth_city_id"]})._id_dil
-        )
-        if printer.__dict__["birth_city_id"]
-        else None,
+        "birth_city_id": city_lookup.get_id_dil(db, printer.birth_city_id),
         "personal_information": printer.personal_information,
         "professional_information": printer.professional_information,
         "personal_addresses": [
@@ -153,9 +196,7 @@ def enhance_printer_response(
                 else None,
                 "label": address.address_persons.label,
                 "city_label": address.address_persons.city_label,
-                "city_id": str(address.address_persons.city._id_dil)
-                if address.address_persons.city_id
-                else None,
+                "city_id": city_lookup.get_id_dil(db, address.address_persons.city_id),
                 "date_occupation": address.date_occupation,
             }
             for address in printer.addresses_relations
@@ -186,7 +227,10 @@ def get_printer(
     :rtype: dict | Type[Person] | None
     """
     html_markup = args.pop("html", False)
-    printer = db.query(Person).filter_by(**args).first()
+    query = db.query(Person)
+    if enhance:
+        query = query.options(*printer_detail_options())
+    printer = query.filter_by(**args).first()
     if printer:
         if enhance:
             return enhance_printer_response(db, printer, html_markup=html_markup)
@@ -213,12 +257,15 @@ def get_printers(db: Session, args: dict, enhance: bool = False) -> list:
     printers = db.query(Person).filter_by(**args).all()
     if len(printers) > 0:
         if enhance:
+            total_patents = BatchLoader(db).count_many(
+                Patent.person_id, [printer.id for printer in printers]
+            )
             res = [
                 {
                     "_id_dil": str(printer._id_dil) if printer._id_dil else None,
                     "lastname": printer.lastname,
                     "firstnames": normalize_firstnames(printer.firstnames),
-                    "total_patents": len(printer.patents),
+                    "total_patents": total_patents[printer.id],
                 }
                 for printer in printers
             ]
@@ -246,7 +293,10 @@ def get_patent(
     :rtype: dict | Type[Patent] | None
     """
     html_markup = args.pop("html", False)
-    patent = db.query(Patent).filter_by(**args).first()
+    query = db.query(Patent)
+    if enhance:
+        query = query.options(*patent_detail_options())
+    patent = query.filter_by(**args).first()
     if patent:
         if enhance:
             return enhance_patent_response(db, patent, html_markup=html_markup)
@@ -340,3 +390,86 @@ def get_patents(db: Session, args: dict) -> list:
     :rtype: list
     """
     return db.query(Patent).filter_by(**args).all()
+
+
+# -- Async variants -- #
+# The queries are shared with the sync functions above: they run on the
+# sync session proxied by the AsyncSession, inside its greenlet, so the
+# event loop is released while SQLite works.
+
+
+async def get_printer_async(
+    db: AsyncSession, args: dict, enhance: bool = False
+) -> Union[dict, Type[Person], None]:
+    """Get a printer from the database (async variant of `get_printer`).
+
+    :param db: The async database session to use for the query.
+    :type db: AsyncSession
+    :param args: A dictionary of filter arguments to apply to the query.
+    :type args: dict
+    :param enhance: A boolean indicating whether to enhance the printer response with cleaner HTML and related
+                    entities.
+    :type enhance: bool
+    :return: A dictionary containing the enhanced printer information if enhance is True, the Person object
+                if enhance is False, or None if no matching printer is found.
+    :rtype: dict | Type[Person] | None
+    """
+    return await db.run_sync(get_printer, args, enhance)
+
+
+async def get_patent_async(
+    db: AsyncSession, args: dict, enhance: bool = False
+) -> Union[dict, Type[Patent], None]:
+    """Get a patent (async variant of `get_patent`).
+
+    :param db: The async database session to use for the query.
+    :type db: AsyncSession
+    :param args: A dictionary of filter arguments to apply to the query.
+    :type args: dict
+    :param enhance: A boolean indicating whether to enhance the patent response with cleaner HTML and related
+                    entities.
+    :type enhance: bool
+    :return: A dictionary containing the enhanced patent information if enhance is True, the Patent object
+                if enhance is False, or None if no matching patent is found.
+    :rtype: dict | Type[Patent] | None
+    """
+    return await db.run_sync(get_patent, args, enhance)
+
+
+async def get_city_async(db: AsyncSession, args: dict) -> Union[City, None]:
+    """Get a city (async variant of `get_city`).
+
+    :param db: The async database session to use for the query.
+    :type db: AsyncSession
+    :param args: A dictionary of filter arguments to apply to the query.
+    :type args: dict
+    :return: The first City object that matches the filter criteria, or None if no match is found.
+    :rtype: City | None
+    """
+    return await db.run_sync(get_city, args)
+
+
+async def get_address_async(db: AsyncSession, args: dict) -> Union[Address, None]:
+    """Get an address (async variant of `get_address`).
+
+    :param db: The async database session to use for the query.
+    :type db: AsyncSession
+    :param args: A dictionary of filter arguments to apply to the query.
+    :type args: dict
+    :return: The first Address object that matches the filter criteria, or None if no match is found.
+    :rtype: Address | None
+    """
+    return await db.run_sync(get_address, args)
+
+
+async def get_city_id_dil_async(db: AsyncSession, city_id: int) -> Union[str, None]:
+    """Get the DIL ID of a city from its primary key through the city lookup.
+
+    :param db: The async database session used on a lookup miss.
+    :type db: AsyncSession
+    :param city_id: The primary key of the city.
+    :type city_id: int
+    :return: The DIL ID of the city, or None if not found.
+    :rtype: str | None
+    """
+    return await db.run_sync(city_lookup.get_id_dil, city_id)
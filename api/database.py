@@ -7,17 +7,24 @@ Database connection and session management.
 
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from api.config import BASE_DIR, settings
 
-SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(BASE_DIR, settings.DB_URI)}"
+DB_PATH = os.path.join(BASE_DIR, settings.DB_URI)
+SQLALCHEMY_DATABASE_URI = f"sqlite:///{DB_PATH}"
+# read-only connections (the admin interface keeps the only writers)
+SQLALCHEMY_DATABASE_READ_URI = f"sqlite:///file:{DB_PATH}?mode=ro&uri=true"
+SQLALCHEMY_DATABASE_ASYNC_READ_URI = f"sqlite+aiosqlite:///file:{DB_PATH}?mode={'ro' if settings.DB_READ_ONLY_API else 'rw'}&uri=true"
 # WHOOSH_INDEX_DIR = os.path.join(BASE_DIR, settings.WHOOSH_INDEX_DIR)
 print(f"Using database URI: {SQLALCHEMY_DATABASE_URI}")
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URI,
+
+POOL_OPTIONS = dict(
     # needed for sqlite
     connect_args={"check_same_thread": False},
     pool_size=20,
@@ -28,7 +35,81 @@ engine = create_engine(
 )
 
 
+def connection_pragmas(read_only: bool = False) -> dict:
+    """Get the PRAGMA statements of the SQLite connection profile.
+
+    The journal mode is persistent in the database file, so it is only
+    set by writer connections.
+
+    :param read_only: Whether the pragmas are for a read-only connection.
+    :type read_only: bool
+    :return: A dictionary mapping each pragma to its value.
+    :rtype: dict
+    """
+    pragmas = {
+        "journal_mode": "" if read_only else settings.DB_JOURNAL_MODE,
+        "synchronous": settings.DB_SYNCHRONOUS,
+        "temp_store": settings.DB_TEMP_STORE,
+        "mmap_size": settings.DB_MMAP_SIZE,
+        "cache_size": settings.DB_CACHE_SIZE,
+    }
+    return {name: value for name, value in pragmas.items() if value != ""}
+
+
+def set_connection_profile(engine_: Engine, read_only: bool = False) -> Engine:
+    """Apply the SQLite connection profile on each new connection of an engine.
+
+    :param engine_: The engine to configure.
+    :type engine_: Engine
+    :param read_only: Whether the engine opens read-only connections.
+    :type read_only: bool
+    :return: The configured engine.
+    :rtype: Engine
+    """
+    pragmas = connection_pragmas(read_only=read_only)
+
+    @event.listens_for(engine_, "connect")
+    def _set_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return engine_
+
+
+engine = set_connection_profile(create_engine(SQLALCHEMY_DATABASE_URI, **POOL_OPTIONS))
+read_engine = (
+    set_connection_profile(
+        create_engine(SQLALCHEMY_DATABASE_READ_URI, **POOL_OPTIONS), read_only=True
+    )
+    if settings.DB_READ_ONLY_API
+    else engine
+)
+
+
+# async engine for the API routes that await the database instead of
+# holding a threadpool worker (aiosqlite runs each connection in its own thread)
+async_read_engine = create_async_engine(
+    SQLALCHEMY_DATABASE_ASYNC_READ_URI,
+    # aiosqlite defaults to NullPool for files, keep connections open instead
+    poolclass=AsyncAdaptedQueuePool,
+    **POOL_OPTIONS,
+)
+set_connection_profile(
+    async_read_engine.sync_engine, read_only=settings.DB_READ_ONLY_API
+)
+
+
 session = scoped_session(sessionmaker(engine, autocommit=False, autoflush=False))
+read_session = scoped_session(
+    sessionmaker(read_engine, autocommit=False, autoflush=False)
+)
+async_read_session = async_sessionmaker(
+    async_read_engine, autoflush=False, expire_on_commit=False
+)
 BASE = declarative_base()
 
 
@@ -48,3 +129,33 @@ def get_db() -> scoped_session:
         raise
     finally:
         db.close()
+
+
+# Dependency for FastAPI read endpoints
+# to get a read-only database connection.
+def get_read_db() -> scoped_session:
+    """
+    Get a read-only database connection.
+    :return: scoped_session
+    :rtype: scoped_session
+    """
+    db = read_session
+    try:
+        yield db
+    except:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# Dependency for async FastAPI read endpoints
+# to get an async read-only database connection.
+async def get_async_db() -> AsyncSession:
+    """
+    Get an async read-only database connection.
+    :return: AsyncSession
+    :rtype: AsyncSession
+    """
+    async with async_read_session() as db:
+        yield db
@@ -6,11 +6,12 @@ Whoosh index utils for creating and clearing indexes.
 
 from shutil import rmtree
 import bleach
-from unidecode import unidecode
 from tqdm import tqdm
 from whoosh import index
 from joblib import Parallel, delayed
 
+from api.api_utils import normalize_sort_key
+
 
 def create_store(store, path: str) -> None:
     """Create a Whoosh index store at the specified path, clearing any existing index if necessary.
@@ -87,7 +88,7 @@ def extract_data(printer: any) -> dict:
 
     return dict(
         id_dil=str(printer._id_dil),
-        lastname=unidecode(printer.lastname or "").lower(),
+        lastname=printer.lastname_sort or normalize_sort_key(printer.lastname),
         text=content,
     )
 
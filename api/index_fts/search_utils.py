@@ -6,13 +6,13 @@ Utilities for searching the Whoosh index with normalized queries and handling re
 
 import re
 from html import escape
-from unidecode import unidecode
 
 from whoosh.qparser import QueryParser, AndGroup, OrGroup, MultifieldParser
 from whoosh.query import And
 from whoosh.highlight import HtmlFormatter, ContextFragmenter
 
 from api.index_fts.index_conf import st
+from api.api_utils import normalize_sort_key
 
 
 def extract_quoted_phrases(query: str) -> list[str]:
@@ -106,9 +106,7 @@ def search_whoosh(
         return query.strip()
 
     query_lastname = (
-        remove_first_joker(unidecode(query_lastname.lower().strip()))
-        if query_lastname
-        else ""
+        remove_first_joker(normalize_sort_key(query_lastname)) if query_lastname else ""
     )
     query_content = remove_first_joker(query_content.strip()) if query_content else ""
 
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""loaders.py
+
+Request-scoped batching of relationship lookups (DataLoader pattern).
+Foreign keys needed to render a page are collected first, then resolved with
+one `IN (...)` query per key column, so the number of queries stays constant
+whatever the page size.
+"""
+
+from collections import defaultdict
+from typing import Iterable
+
+from fastapi import Depends
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from api.database import get_read_db
+
+# stay below the SQLite host parameters limit
+IN_CHUNK_SIZE = 500
+
+
+def _chunks(keys: list, size: int = IN_CHUNK_SIZE) -> Iterable[list]:
+    """Split a list of keys in chunks of at most `size` keys."""
+    for i in range(0, len(keys), size):
+        yield keys[i : i + size]
+
+
+class BatchLoader:
+    """Collect foreign keys and resolve them with one query per key column.
+
+    Usage::
+
+        loader = BatchLoader(db)
+        loader.prime(Patent.person_id, person_ids)
+        for person_id in person_ids:
+            patents = loader.get(Patent.person_id, person_id)
+
+    Results are memoized for the lifetime of the loader (i.e. one request).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._specs = {}
+        self._pending = defaultdict(set)
+        self._results = defaultdict(dict)
+
+    def _key(self, key_column: any) -> str:
+        return str(key_column)
+
+    def prime(
+        self,
+        key_column: any,
+        keys: Iterable,
+        columns: tuple = (),
+        order_by: tuple = (),
+        options: tuple = (),
+    ) -> "BatchLoader":
+        """Register keys to resolve on next dispatch.
+
+        :param key_column: The column holding the keys (e.g. `Patent.person_id`).
+        :type key_column: InstrumentedAttribute
+        :param keys: The keys to resolve, None values are ignored.
+        :type keys: Iterable
+        :param columns: Columns to select instead of full entities (optional).
+        :type columns: tuple
+        :param order_by: Order of the rows inside each group (optional).
+        :type order_by: tuple
+        :param options: Loader options applied when full entities are selected (optional).
+        :type options: tuple
+        :return: The loader itself.
+        :rtype: BatchLoader
+        """
+        name = self._key(key_column)
+        self._specs.setdefault(name, (key_column, columns, order_by, options))
+        done = self._results[name]
+        self._pending[name].update(k for k in keys if k is not None and k not in done)
+        return self
+
+    def dispatch(self) -> None:
+        """Resolve all pending keys, one `IN (...)` query per key column (and per chunk)."""
+        for name, keys in self._pending.items():
+            if not keys:
+                continue
+            key_column, columns, order_by, options = self._specs[name]
+            results = self._results[name]
+            for key in keys:
+                results[key] = []
+            for chunk in _chunks(sorted(keys)):
+                if columns:
+                    query = self.db.query(key_column.label("_batch_key"), *columns)
+                else:
+                    query = self.db.query(key_column.class_, key_column).options(
+                        *options
+                    )
+                query = query.filter(key_column.in_(chunk)).order_by(*order_by)
+                for row in query.all():
+                    if columns:
+                        results[row._batch_key].append(row)
+                    else:
+                        results[row[1]].append(row[0])
+            keys.clear()
+
+    def get(self, key_column: any, key: any) -> list:
+        """Get the rows related to a key, dispatching pending keys if needed.
+
+        :param key_column: The column holding the keys (e.g. `Patent.person_id`).
+        :type key_column: InstrumentedAttribute
+        :param key: The key to look up.
+        :type key: any
+        :return: The list of rows (or entities) related to the key.
+        :rtype: list
+        """
+        name = self._key(key_column)
+        if key is None:
+            return []
+        if key not in self._results[name]:
+            self.prime(key_column, [key])
+            self.dispatch()
+        return self._results[name].get(key, [])
+
+    def load_many(self, key_column: any, keys: Iterable, **kwargs) -> dict:
+        """Prime and resolve keys at once.
+
+        :param key_column: The column holding the keys (e.g. `Patent.person_id`).
+        :type key_column: InstrumentedAttribute
+        :param keys: The keys to resolve.
+        :type keys: Iterable
+        :return: A dictionary mapping each key to its list of rows.
+        :rtype: dict
+        """
+        keys = [k for k in keys if k is not None]
+        self.prime(key_column, keys, **kwargs).dispatch()
+        results = self._results[self._key(key_column)]
+        return {k: results.get(k, []) for k in keys}
+
+    def count_many(self, key_column: any, keys: Iterable) -> dict:
+        """Count the rows related to each key with one `GROUP BY` query per chunk.
+
+        :param key_column: The column holding the keys (e.g. `Patent.person_id`).
+        :type key_column: InstrumentedAttribute
+        :param keys: The keys to count rows for.
+        :type keys: Iterable
+        :return: A dictionary mapping each key to its number of rows.
+        :rtype: dict
+        """
+        keys = sorted({k for k in keys if k is not None})
+        counts = dict.fromkeys(keys, 0)
+        for chunk in _chunks(keys):
+            rows = (
+                self.db.query(key_column, func.count())
+                .filter(key_column.in_(chunk))
+                .group_by(key_column)
+                .all()
+            )
+            counts.update(dict(rows))
+        return counts
+
+
+def get_loader(db: Session = Depends(get_read_db)) -> BatchLoader:
+    """FastAPI dependency returning a loader bound to the request session.
+
+    :param db: Database session dependency
+    :type db: Session
+    :return: A new BatchLoader for the current request.
+    :rtype: BatchLoader
+    """
+    return BatchLoader(db)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""lookup_cache.py
+
+Process-wide in-memory lookups for small referentials that are read on every
+request but rarely edited (e.g. cities).
+The lookups are loaded once (at startup or on first access) and kept in sync
+with the writes made through SQLAlchemy sessions (e.g. from the Flask admin)
+thanks to `after_commit` hooks.
+"""
+
+from typing import NamedTuple, Union
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from api.models.models import City
+
+
+class CityEntry(NamedTuple):
+    """Minimal city data kept in memory."""
+
+    id: int
+    id_dil: str
+    label: str
+    department_label: Union[str, None]
+
+
+class CityLookup:
+    """Bidirectional map between city primary keys and city `_id_dil`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id = {}
+        self._by_id_dil = {}
+        self.loaded = False
+
+    def load(self, db: Session) -> None:
+        """(Re)load all cities from the database.
+
+        :param db: The database session to use for the query.
+        :type db: Session
+        """
+        rows = db.query(
+            City.id, City._id_dil, City.label, City.insee_fr_department_label
+        ).all()
+        by_id = {row[0]: CityEntry(*row) for row in rows}
+        with self._lock:
+            self._by_id = by_id
+            self._by_id_dil = {entry.id_dil: entry for entry in by_id.values()}
+            self.loaded = True
+
+    def invalidate(self) -> None:
+        """Drop the lookup, it will be reloaded on next access."""
+        with self._lock:
+            self._by_id = {}
+            self._by_id_dil = {}
+            self.loaded = False
+
+    def patch(self, entry: CityEntry) -> None:
+        """Insert or replace a city in the lookup.
+
+        :param entry: The city entry to insert or replace.
+        :type entry: CityEntry
+        """
+        with self._lock:
+            old = self._by_id.get(entry.id)
+            if old is not None:
+                self._by_id_dil.pop(old.id_dil, None)
+            self._by_id[entry.id] = entry
+            self._by_id_dil[entry.id_dil] = entry
+
+    def discard(self, city_id: int) -> None:
+        """Remove a city from the lookup.
+
+        :param city_id: The primary key of the city to remove.
+        :type city_id: int
+        """
+        with self._lock:
+            old = self._by_id.pop(city_id, None)
+            if old is not None:
+                self._by_id_dil.pop(old.id_dil, None)
+
+    def get(self, db: Session, city_id: int) -> Union[CityEntry, None]:
+        """Get a city entry by primary key.
+
+        The lookup is loaded on first access. A city unknown to the lookup (e.g. created by
+        another process) is fetched from the database and added to the lookup.
+
+        :param db: The database session to use if the lookup has to hit the database.
+        :type db: Session
+        :param city_id: The primary key of the city.
+        :type city_id: int
+        :return: The city entry, or None if no city matches.
+        :rtype: CityEntry | None
+        """
+        if city_id is None:
+            return None
+        if not self.loaded:
+            self.load(db)
+        entry = self._by_id.get(city_id)
+        if entry is None:
+            row = (
+                db.query(
+                    City.id, City._id_dil, City.label, City.insee_fr_department_label
+                )
+                .filter(City.id == city_id)
+                .first()
+            )
+            if row is None:
+                return None
+            entry = CityEntry(*row)
+            self.patch(entry)
+        return entry
+
+    def get_by_id_dil(self, db: Session, id_dil: str) -> Union[CityEntry, None]:
+        """Get a city entry by `_id_dil`.
+
+        :param db: The database session to use if the lookup has to hit the database.
+        :type db: Session
+        :param id_dil: The DIL ID of the city.
+        :type id_dil: str
+        :return: The city entry, or None if no city matches.
+        :rtype: CityEntry | None
+        """
+        if not self.loaded:
+            self.load(db)
+        return self._by_id_dil.get(id_dil)
+
+    def get_id_dil(self, db: Session, city_id: int) -> Union[str, None]:
+        """Turn a city primary key into its public `_id_dil`.
+
+        :param db: The database session to use if the lookup has to hit the database.
+        :type db: Session
+        :param city_id: The primary key of the city.
+        :type city_id: int
+        :return: The DIL ID of the city, or None if no city matches.
+        :rtype: str | None
+        """
+        entry = self.get(db, city_id)
+        return str(entry.id_dil) if entry else None
+
+
+city_lookup = CityLookup()
+
+_CITY_CHANGES_KEY = "city_lookup_changes"
+
+
+@event.listens_for(City, "after_insert")
+@event.listens_for(City, "after_update")
+def track_city_upsert(mapper, connection, target):
+    """Record an inserted or updated city, the lookup is patched once the session commits."""
+    db = object_session(target)
+    if db is not None:
+        db.info.setdefault(_CITY_CHANGES_KEY, []).append(
+            (
+                "upsert",
+                CityEntry(
+                    target.id,
+                    target._id_dil,
+                    target.label,
+                    target.insee_fr_department_label,
+                ),
+            )
+        )
+
+
+@event.listens_for(City, "after_delete")
+def track_city_delete(mapper, connection, target):
+    """Record a deleted city, the lookup is patched once the session commits."""
+    db = object_session(target)
+    if db is not None:
+        db.info.setdefault(_CITY_CHANGES_KEY, []).append(("delete", target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def apply_city_changes(db):
+    """Patch the city lookup with the changes committed by the session."""
+    for action, value in db.info.pop(_CITY_CHANGES_KEY, []):
+        if action == "upsert":
+            city_lookup.patch(value)
+        else:
+            city_lookup.discard(value)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_city_changes(db):
+    """Forget the city changes of a rolled back transaction."""
+    db.info.pop(_CITY_CHANGES_KEY, None)
@@ -11,6 +11,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 
 from api.admin import flask_app
+from api.database import engine, read_session
+from api.lookup_cache import city_lookup
 from api.routes import api_router
 
 from api.api_meta import METADATA
@@ -49,6 +51,21 @@ def create_app() -> FastAPI:
     )
     # extensions
     add_pagination(_app)
+
+    @_app.on_event("startup")
+    def open_database() -> None:
+        """Open a writer connection first, so the journal mode is set before read-only connections."""
+        with engine.connect():
+            pass
+
+    @_app.on_event("startup")
+    def load_lookups() -> None:
+        """Load the in-memory referential lookups before serving requests."""
+        try:
+            city_lookup.load(read_session)
+        finally:
+            read_session.remove()
+
     # Add routes
     _app.include_router(api_router, prefix="/dil-db/api")
     # Mount admin interface (flask app) into FastAPI app
@@ -19,7 +19,6 @@ import string
 import uuid
 import time
 from functools import wraps
-from unidecode import unidecode
 
 from sqlalchemy import (
     Column,
@@ -30,6 +29,7 @@ from sqlalchemy import (
     event,
     ForeignKey,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import relationship, declared_attr, sessionmaker
 from sqlalchemy.exc import IntegrityError
@@ -48,6 +48,7 @@ from ..index_fts.index_conf import st
 from ..index_fts.index_utils import prepare_content
 
 from api.config import settings
+from api.api_utils import normalize_sort_key
 
 # DB models constants and utilities
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tiff"}
@@ -277,6 +278,16 @@ class AbstractBase(BASE):
         if isinstance(target, Patent):
             target.references = correct_br_markup_quill(target.references or "")
 
+    @classmethod
+    def set_lastname_sort(cls, target: any) -> None:
+        """Keeps the accent-folded, lowercased sort key of a Person instance in sync with its lastname.
+
+        :param target: The object instance (e.g., Person) for which to set the sort key.
+        :type target: any
+        """
+        if isinstance(target, Person):
+            target.lastname_sort = normalize_sort_key(target.lastname)
+
     @classmethod
     def check_person_exists(cls, session: any, target: any) -> None:
         """Checks if the associated person exists in the database when creating or updating a Patent instance, and raises an IntegrityError if the person does not exist.
@@ -368,8 +379,7 @@ class AbstractBase(BASE):
         if cls.__tablename__ == "persons":
             writer = ix.writer()
             clean_text = prepare_content(target)
-            lastname = target.lastname or ""
-            lastname = unidecode(lastname or "").lower().encode("utf-8").decode("utf-8")
+            lastname = target.lastname_sort or normalize_sort_key(target.lastname)
             writer.update_document(
                 id_dil=str(target._id_dil).encode("utf-8").decode("utf-8"),
                 lastname=lastname,
@@ -400,8 +410,7 @@ class AbstractBase(BASE):
         if cls.__tablename__ == "persons":
             writer = ix.writer()
             clean_text = prepare_content(target)
-            lastname = target.lastname or ""
-            lastname = unidecode(lastname or "").lower().encode("utf-8").decode("utf-8")
+            lastname = target.lastname_sort or normalize_sort_key(target.lastname)
             writer.add_document(
                 id_dil=str(target._id_dil).encode("utf-8").decode("utf-8"),
                 lastname=lastname,
@@ -441,6 +450,7 @@ def before_insert_or_update(_, connection, target):
     """Event listener for before insert or update events on AbstractBase, which performs various checks and updates on the target object (e.g., correcting markup, checking associated person existence, setting image names, and ensuring pinned image relations) before the database operation is executed."""
     with sessionmaker(bind=connection)() as session:
         target.correct_markup(target)
+        target.set_lastname_sort(target)
         target.check_person_exists(session, target)
         target.set_img_name(target)
         target.check_img_patent_relations_pinned(target, session)
@@ -598,6 +608,8 @@ class Person(AbstractVersion):
     :type _id_dil: STRING(25)
     :param lastname: Nom de famille de la personne. [REQ.]
     :type lastname: STRING
+    :param lastname_sort: Clé de tri du nom de famille (sans accents, en minuscules), calculée automatiquement. [AUTO.]
+    :type lastname_sort: STRING
     :param firstnames: Prénoms de la personne. [OPT.]
     :type firstnames: STRING
     :param birth_date: Date de naissance de la personne. [OPT.]
@@ -620,6 +632,7 @@ class Person(AbstractVersion):
     # -------------------------------------------------------
 
     lastname = Column(String, nullable=False, unique=False)
+    lastname_sort = Column(String, nullable=True, unique=False, default=None)
     firstnames = Column(String, nullable=True, unique=False, default=None)
     birth_date = Column(String(25), nullable=True, unique=False, default=None)
     birth_city_label = Column(String, nullable=True, unique=False, default=None)
@@ -675,6 +688,10 @@ class Person(AbstractVersion):
         return f"{self.lastname} {self.firstnames}"
 
 
+# backs the sort on lastname and the keyset pagination on (lastname_sort, id)
+Index("ix_persons_lastname_sort", Person.lastname_sort, Person.id)
+
+
 class Patent(AbstractVersion):
     """Brevets des imprimeurs et lithographes identifiés.
 
@@ -5,21 +5,32 @@ routes.py
 FastAPI routes for the DIL API.
 """
 
+from math import ceil
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, set_page
+from fastapi_pagination import Page, set_page, resolve_params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from fastapi_pagination.customization import CustomizedPage
 
 from sqlalchemy import or_, and_, func, asc, desc, distinct
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, Query as SAQuery, joinedload
 from cachetools import TTLCache, cached
 import hashlib
 
-from api.database import get_db
-from api.crud import get_printer, get_patent, get_city, get_address
+from api.database import get_read_db, get_async_db
+from api.crud import (
+    get_printer,
+    get_printer_async,
+    get_patent_async,
+    get_city_async,
+    get_address_async,
+    get_city_id_dil_async,
+)
+from api.loaders import BatchLoader, get_loader
+from api.lookup_cache import city_lookup
 from api.schemas import (
     Message,
     PatentMinimalOut,
@@ -28,13 +39,26 @@ from api.schemas import (
     CityOut,
     AddressOut,
     PrinterMinimalResponseOut,
+    PrinterPageOut,
     CityOutMinimal,
     PrinterOut,
     PatentOut,
 )
-from api.models.models import Person, Patent, City, Address
+from api.models.models import (
+    Person,
+    Patent,
+    City,
+    Address,
+    PatentHasImages,
+)
 from api.index_fts.search_utils import search_whoosh
-from api.api_utils import normalize_firstnames, normalize_date, period_bounds
+from api.api_utils import (
+    normalize_firstnames,
+    normalize_date,
+    period_bounds,
+    encode_cursor,
+    decode_cursor,
+)
 
 api_router = APIRouter()
 # cache for whoosh search results, with a TTL of 120 seconds and max size of 2048 entries
@@ -48,7 +72,7 @@ cache = TTLCache(maxsize=2048, ttl=120)
     responses={500: {"model": Message}},
     summary="Get generic API information about data (e.g. total)",
 )
-def get_infos(db: Session = Depends(get_db)):
+def get_infos(db: Session = Depends(get_read_db)):
     """Retrieve generic information about the API data.
 
     :param db: Database session dependency
@@ -88,7 +112,7 @@ def get_infos(db: Session = Depends(get_db)):
     tags=["Map"],
 )
 def get_cities_with_printers(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     patent_city_query: Optional[List[str]] = Query(None),
     patent_date_start: Optional[str] = Query(None),
     exact_patent_date_start: Optional[str] = Query(None),
@@ -244,7 +268,7 @@ def get_cities_with_printers(
 def autocomplete_city(
     q: Optional[str] = Query(None),
     selected: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[dict]:
     """Autocomplete cities based on a query string and optional selected city filters.
 
@@ -317,13 +341,19 @@ def autocomplete_city(
     summary="",
     tags=["Images"],
 )
-def read_images(id: str, db: Session = Depends(get_db)):
+def read_images(
+    id: str,
+    db: Session = Depends(get_read_db),
+    loader: BatchLoader = Depends(get_loader),
+):
     """Retrieve all images related to a specific person (printer) by their DIL ID, including patent associations and pinned status.
 
     :param id: The DIL ID of the person (printer) to retrieve images for. e.g., "person_dil_2QO3gEnU".
     :type id: str
     :param db: Database session dependency
     :type db: Session
+    :param loader: Request-scoped batch loader dependency
+    :type loader: BatchLoader
     :return: A structured response containing the person's DIL ID, a list of their patents with associated images and pinned status, total image counts, and a list of pinned images. If the person is not found, returns a JSONResponse with a 404 status code and an error message. If any other error occurs, returns a JSONResponse with a 500 status code and the error message.
     :rtype: Union[JSONResponse, PersonPatentsImages]
     """
@@ -336,6 +366,11 @@ def read_images(id: str, db: Session = Depends(get_db)):
 
         patent_images = []
         images_pinned = []
+        images_by_patent = loader.load_many(
+            PatentHasImages.patent_id,
+            [patent.id for patent in printer.patents],
+            options=(joinedload(PatentHasImages.image_patents),),
+        )
 
         for patent in printer.patents:
             images = [
@@ -349,7 +384,7 @@ def read_images(id: str, db: Session = Depends(get_db)):
                     "iiif_url": getattr(image_rel.image_patents, "iiif_url", None),
                     "is_pinned": image_rel.is_pinned,
                 }
-                for image_rel in patent.images_relations
+                for image_rel in images_by_patent[patent.id]
             ]
             images_pinned.extend(filter(lambda img: img["is_pinned"], images))
             patent_images.append(
@@ -399,27 +434,92 @@ def cached_search(lastname: str, content: str) -> dict:
     return search_whoosh(query_lastname=lastname, query_content=content)
 
 
+def keyset_paginate(
+    query: SAQuery, cursor: str, size: int, descending: bool = False
+) -> tuple[list, Optional[str], Optional[str]]:
+    """Paginate persons by seeking on (lastname sort key, person id) instead of using OFFSET.
+
+    The query must select the sort key labelled `sort_key` and the person id labelled `person_pk`.
+    Every page costs the same whatever its depth, as SQLite seeks directly to the cursor
+    position through the `ix_persons_lastname_sort` index.
+
+    :param query: The filtered query on persons (not ordered).
+    :type query: sqlalchemy.orm.Query
+    :param cursor: An opaque cursor from a previous page, or an empty string for the first page.
+    :type cursor: str
+    :param size: The number of items per page.
+    :type size: int
+    :param descending: Whether persons are sorted by descending lastname.
+    :type descending: bool
+    :return: A tuple (rows, next_cursor, prev_cursor).
+    :rtype: tuple[list, Optional[str], Optional[str]]
+    :raises ValueError: If the cursor is malformed.
+    """
+    direction, values = decode_cursor(cursor) if cursor else ("next", None)
+    backward = direction == "prev"
+    # scan in the reverse order to fetch the page before the cursor
+    reverse = descending != backward
+    if values is not None:
+        if len(values) != 2:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        key, pk = values
+        # (sort key, id) > (key, pk), spelled out so that SQLite seeks in the index
+        if reverse:
+            seek = and_(
+                Person.lastname_sort <= key,
+                or_(Person.lastname_sort < key, Person.id < pk),
+            )
+        else:
+            seek = and_(
+                Person.lastname_sort >= key,
+                or_(Person.lastname_sort > key, Person.id > pk),
+            )
+        query = query.filter(seek)
+    order = desc if reverse else asc
+    rows = (
+        query.order_by(order(Person.lastname_sort), order(Person.id))
+        .limit(size + 1)
+        .all()
+    )
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if backward:
+        rows.reverse()
+    if not rows:
+        return rows, None, None
+
+    first = encode_cursor("prev", (rows[0].sort_key, rows[0].person_pk))
+    last = encode_cursor("next", (rows[-1].sort_key, rows[-1].person_pk))
+    if backward:
+        return rows, last, first if has_more else None
+    return rows, last if has_more else None, first if values is not None else None
+
+
 @api_router.get(
     "/persons",
-    response_model=Page[PrinterMinimalResponseOut],
+    response_model=PrinterPageOut,
     include_in_schema=True,
     responses={400: {"model": Message}, 500: {"model": Message}},
     summary="Retrieve all persons (printers) with optional filters",
     tags=["Persons"],
 )
 def read_printers(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
+    loader: BatchLoader = Depends(get_loader),
     search_head_info: Optional[str] = Query(None),
     search_extra_info: Optional[str] = Query(None),
     patent_city_query: Optional[List[str]] = Query(None),
     patent_date_start: Optional[str] = Query(None),
     exact_patent_date_start: bool = Query(False),
     sort: Optional[str] = Query("asc"),
+    cursor: Optional[str] = Query(None),
 ):
     """Retrieve all persons (printers) with optional filters for search, city, and patent date, along with pagination and sorting.
 
     :param db: Database session dependency
     :type db: Session
+    :param loader: Request-scoped batch loader dependency
+    :type loader: BatchLoader
     :param search_head_info: Optional string to search in the person's lastname.
     :type search_head_info: Optional[str]
     :param search_extra_info: Optional string to search in the person's patents content.
@@ -432,6 +532,8 @@ def read_printers(
     :type exact_patent_date_start: bool
     :param sort: Optional string to specify sorting order by lastname ('asc' or 'desc'), defaults to 'asc'.
     :type sort: Optional[str]
+    :param cursor: Optional opaque cursor to use keyset pagination instead of page numbers; pass an empty value for the first page, then the returned `next_cursor`/`prev_cursor`.
+    :type cursor: Optional[str]
     :return: A paginated response containing a list of printers that match the provided filters, along with their total patent counts and exercise places summary. If any error occurs during processing, returns a JSONResponse with a 500 status code and the error message.
     :rtype: Union[JSONResponse, Page]
     """
@@ -448,26 +550,16 @@ def read_printers(
             whoosh_ids = list(whoosh_hits.keys())
 
             if not whoosh_ids:
-                return Page(page=1, total=0, items=[], size=20, pages=0)
+                return PrinterPageOut(page=1, total=0, items=[], size=20, pages=0)
 
-        # -- 1) sub-request : total patents--
-        patent_count_subq = (
-            db.query(
-                Patent.person_id.label("pid"),
-                func.count(Patent.id).label("total_patents"),
-            )
-            .group_by(Patent.person_id)
-            .subquery()
-        )
-
-        # -- 2) base request --
+        # -- 1) base request (total patents are computed for the page only) --
         q = db.query(
             Person._id_dil.label("id_dil"),
             Person.lastname,
             Person.firstnames,
-            func.coalesce(patent_count_subq.c.total_patents, 0).label("total_patents"),
             Person.id.label("person_pk"),
-        ).outerjoin(patent_count_subq, patent_count_subq.c.pid == Person.id)
+            Person.lastname_sort.label("sort_key"),
+        )
 
         # -- 3) Whoosh filter --
         if whoosh_ids is not None:
@@ -515,69 +607,65 @@ def read_printers(
                 period_subq = period_subq.group_by(Patent.person_id).subquery()
                 q = q.join(period_subq, period_subq.c.pid == Person.id)
 
-        # -- 6) Sorting --
-        order_expr = func.replace(func.replace(Person.lastname, "É", "E"), "È", "E")
-        q = q.order_by(desc(order_expr) if sort == "desc" else asc(order_expr))
-
-        # -- 7) Pagination --
-        paginated = paginate(db, q)
-
-        person_pks = [p.person_pk for p in paginated.items]
-
-        patents_rows = (
-            db.query(
-                Patent.person_id,
-                Patent.city_label,
-                Patent.date_start,
-                Patent.date_end,
+        # -- 6) Sorting & 7) Pagination --
+        descending = sort == "desc"
+        next_cursor = prev_cursor = None
+        if cursor is None:
+            order = desc if descending else asc
+            paginated = paginate(
+                db, q.order_by(order(Person.lastname_sort), order(Person.id))
             )
-            .filter(Patent.person_id.in_(person_pks))
-            .order_by(Patent.person_id, Patent.date_start.asc())
-            .all()
+            rows = paginated.items
+            page, size, total = paginated.page, paginated.size, paginated.total
+        else:
+            size = resolve_params().size
+            try:
+                rows, next_cursor, prev_cursor = keyset_paginate(
+                    q, cursor, size, descending=descending
+                )
+            except ValueError as e:
+                return JSONResponse(status_code=400, content={"message": str(e)})
+            page, total = None, q.count()
+
+        patents_by_person = loader.load_many(
+            Patent.person_id,
+            [p.person_pk for p in rows],
+            columns=(Patent.city_label, Patent.date_start, Patent.date_end),
+            order_by=(Patent.date_start.asc(),),
         )
 
-        patents_by_person = {}
-        for row in patents_rows:
-            patents_by_person.setdefault(row.person_id, []).append(
-                {
-                    "city_label": row.city_label,
-                    "date_start": row.date_start,
-                    "date_end": row.date_end,
-                }
-            )
-
         # -- 8) Output transformation --
         items = []
 
-        for p in paginated.items:
-            exercise_places_summary = []
-
-            for patent in patents_by_person.get(p.person_pk, []):
-                exercise_places_summary.append(
-                    {
-                        "city_label": patent["city_label"] or "Ville inconnue",
-                        "date_start": patent["date_start"],
-                        "date_end": patent["date_end"],
-                    }
-                )
+        for p in rows:
+            exercise_places_summary = [
+                {
+                    "city_label": patent.city_label or "Ville inconnue",
+                    "date_start": patent.date_start,
+                    "date_end": patent.date_end,
+                }
+                for patent in patents_by_person.get(p.person_pk, [])
+            ]
 
             items.append(
                 PrinterMinimalResponseOut(
                     _id_dil=str(p.id_dil),
                     lastname=p.lastname,
                     firstnames=normalize_firstnames(p.firstnames),
-                    total_patents=p.total_patents,
+                    total_patents=len(patents_by_person.get(p.person_pk, [])),
                     highlight=whoosh_hits.get(str(p.id_dil), {}).get("highlight"),
                     exercise_places_summary=exercise_places_summary,
                 )
             )
 
-        return Page(
-            page=paginated.page,
-            total=paginated.total,
+        return PrinterPageOut(
+            page=page,
+            total=total,
             items=items,
-            size=paginated.size,
-            pages=paginated.pages,
+            size=size,
+            pages=ceil(total / size) if size else 0,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
     except Exception as e:
@@ -594,7 +682,9 @@ def read_printers(
     tags=["Persons"],
     response_model=PrinterOut,
 )
-async def read_printer(id: str, html: bool = False, db: Session = Depends(get_db)):
+async def read_printer(
+    id: str, html: bool = False, db: AsyncSession = Depends(get_async_db)
+):
     """
     Retrieve a specific person (printer) by DIL ID.
     - `id`: The DIL ID of the person (printer). e.g., "person_dil_2QO3gEnU".
@@ -604,14 +694,16 @@ async def read_printer(id: str, html: bool = False, db: Session = Depends(get_db
     :type id: str
     :param html: Optional boolean to indicate if the response should include HTML content.
     :type html: bool
-    :param db: Database session dependency
-    :type db: Session
+    :param db: Async database session dependency
+    :type db: AsyncSession
     :return: A PrinterOut object containing detailed information about the person (printer) if found
                 or a JSONResponse with a 404 status code and an error message if the person is not found, or a JSONResponse with a 500 status code and an error message if any other error occurs.
     :rtype: Union[JSONResponse, PrinterOut]
     """
     try:
-        printer = get_printer(db, {"_id_dil": id, "html": html}, enhance=True)
+        printer = await get_printer_async(
+            db, {"_id_dil": id, "html": html}, enhance=True
+        )
         if printer is None:
             return JSONResponse(
                 status_code=404, content={"message": f"Printer with id {id} not found"}
@@ -635,7 +727,7 @@ async def read_printer(id: str, html: bool = False, db: Session = Depends(get_db
     summary="Retrieve all patents with pagination",
     tags=["Patents"],
 )
-def read_patents(db: Session = Depends(get_db)):
+def read_patents(db: Session = Depends(get_read_db)):
     """Retrieve all patents with pagination.
 
     :param db: Database session dependency
@@ -668,14 +760,16 @@ def read_patents(db: Session = Depends(get_db)):
     summary="Retrieve a specific patent by ID",
     tags=["Patents"],
 )
-def read_patent(id: str, db: Session = Depends(get_db), html: bool = False):
+async def read_patent(
+    id: str, db: AsyncSession = Depends(get_async_db), html: bool = False
+):
     """
     Retrieve a specific patent by DIL ID. e.g., "patent_dil_20XQCaDr".
 
     :param id: The DIL ID of the patent to retrieve.
     :type id: str
-    :param db: Database session dependency
-    :type db: Session
+    :param db: Async database session dependency
+    :type db: AsyncSession
     :param html: Optional boolean to indicate if the response should include HTML content.
     :type html: bool
     :return: A PatentOut object containing detailed information about the patent if found
@@ -684,7 +778,7 @@ def read_patent(id: str, db: Session = Depends(get_db), html: bool = False):
     :rtype: Union[JSONResponse, PatentOut]
     """
     try:
-        patent = get_patent(db, {"_id_dil": id, "html": html}, enhance=True)
+        patent = await get_patent_async(db, {"_id_dil": id, "html": html}, enhance=True)
         if patent is None:
             return JSONResponse(
                 status_code=404, content={"message": f"Patent with id {id} not found"}
@@ -708,7 +802,7 @@ def read_patent(id: str, db: Session = Depends(get_db), html: bool = False):
     summary="Retrieve all cities with pagination",
     tags=["Referential"],
 )
-def read_cities(db: Session = Depends(get_db)):
+def read_cities(db: Session = Depends(get_read_db)):
     """Retrieve all cities with pagination.
 
     :param db: Database session dependency
@@ -739,11 +833,11 @@ def read_cities(db: Session = Depends(get_db)):
     summary="Retrieve a specific city by ID",
     tags=["Referential"],
 )
-def read_city(db: Session = Depends(get_db), id: str = None):
+async def read_city(db: AsyncSession = Depends(get_async_db), id: str = None):
     """Retrieve a specific city by DIL ID. e.g., "city_dil_I11CRwcK".
 
-    :param db: Database session dependency
-    :type db: Session
+    :param db: Async database session dependency
+    :type db: AsyncSession
     :param id: The DIL ID of the city to retrieve.
     :type id: str
     :return: A CityOut object containing detailed information about the city if found
@@ -752,7 +846,7 @@ def read_city(db: Session = Depends(get_db), id: str = None):
     :rtype: Union[JSONResponse, CityOut]
     """
     try:
-        city = get_city(db, {"_id_dil": id})
+        city = await get_city_async(db, {"_id_dil": id})
         if city is None:
             return JSONResponse(
                 status_code=404, content={"message": f"Address with id {id} not found"}
@@ -788,7 +882,7 @@ def read_city(db: Session = Depends(get_db), id: str = None):
     summary="Retrieve all addresses with pagination",
     tags=["Referential"],
 )
-def read_addresses(db: Session = Depends(get_db)):
+def read_addresses(db: Session = Depends(get_read_db)):
     """Retrieve all addresses with pagination.
 
     :param db: Database session dependency
@@ -812,9 +906,7 @@ def read_addresses(db: Session = Depends(get_db)):
                 _id_dil=str(address.id_dil) if address.id_dil else None,
                 label=address.label,
                 city_label=address.city_label if address.city_label else None,
-                city_id=str(get_city(db, {"id": int(address.city_id)})._id_dil)
-                if address.city_id
-                else None,
+                city_id=city_lookup.get_id_dil(db, address.city_id),
             )
             for address in paginated_addresses.items
         ]
@@ -842,11 +934,11 @@ def read_addresses(db: Session = Depends(get_db)):
     summary="Retrieve a specific address by ID",
     tags=["Referential"],
 )
-def read_address(db: Session = Depends(get_db), id: str = None):
+async def read_address(db: AsyncSession = Depends(get_async_db), id: str = None):
     """Retrieve a specific address by DIL ID. e.g., "address_dil_k5VNb151".
 
-    :param db: Database session dependency
-    :type db: Session
+    :param db: Async database session dependency
+    :type db: AsyncSession
     :param id: The DIL ID of the address to retrieve.
     :type id: str
     :return: An AddressMinimalOut object containing detailed information about the address if found
@@ -855,7 +947,7 @@ def read_address(db: Session = Depends(get_db), id: str = None):
     :rtype: Union[JSONResponse, AddressMinimalOut]
     """
     try:
-        address = get_address(db, {"_id_dil": id})
+        address = await get_address_async(db, {"_id_dil": id})
         if address is None:
             return JSONResponse(
                 status_code=404, content={"message": f"Address with id {id} not found"}
@@ -864,9 +956,7 @@ def read_address(db: Session = Depends(get_db), id: str = None):
             _id_dil=str(address._id_dil) if address._id_dil else None,
             label=address.label,
             city_label=address.city_label if address.city_label else None,
-            city_id=get_city(db, {"id": int(address.city_id)})._id_dil
-            if address.city_id
-            else None,
+            city_id=await get_city_id_dil_async(db, address.city_id),
         )
         return transformed_address
     except Exception as e:
@@ -880,7 +970,7 @@ def read_address(db: Session = Depends(get_db), id: str = None):
 @api_router.get("/graph", tags=["Graph"])
 def get_graph_data(
     year: int = Query(..., description="Filtrer les brevets dont date_start <= année"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     patents = db.query(Patent).all()
 
@@ -8,6 +8,7 @@ Use for validation and serialization.
 
 from typing import Union, List, Optional
 from pydantic import BaseModel, Field
+from fastapi_pagination import Page
 
 
 class BaseMeta(BaseModel):
@@ -138,6 +139,13 @@ class PrinterMinimalResponseOut(PrinterMinimalOut):
     exercise_places_summary: List[ExercisePlaceSummaryOut] = []
 
 
+class PrinterPageOut(Page[PrinterMinimalResponseOut]):
+    """Schema for a page of printers, with opaque cursors when keyset pagination is used."""
+
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
 class PrinterOut(PrinterMinimalOut):
     """Schema with detailed information on a printer."""
 
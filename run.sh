@@ -19,6 +19,7 @@ usage() {
   echo "Usage: ./run.sh <mode> [-db-re] [-db-back] [-images-back] [instance]"
   echo "  <mode>       : dev | prod (Obligatoire)"
   echo "  -db-re       : Recreate and populate database from resources"
+  echo "  -db-migrate  : Migrate the existing database to the current models"
   echo "  -create-index : Create the index for the database"
   echo "  -images-back : Restore original images from backup"
   #TODO: add command for index creation and populate
@@ -62,6 +63,12 @@ for arg in "$@"; do
       python3 -m scripts.create_db --db $DB
       echo "Database setup complete."
       ;;
+    -db-migrate)
+      echo "Migrating database..."
+      [[ -f $DB ]] || { echo "Database not found. Please create it first."; exit 1; }
+      python3 -m scripts.migrate_db --db $DB
+      echo "Database migration complete."
+      ;;
     -create-index)
       echo "Creating database index..."
       [[ -f $DB ]] || { echo "Database not found. Please create it first."; exit 1; }
@@ -15,6 +15,7 @@ import pandas as pd
 import numpy as np
 
 from scripts.dil_dtypes_spec import DTYPE_SPEC
+from scripts.migrate_db import backfill_lastname_sort
 from api.models.models import (
     BASE,
     City,
@@ -149,6 +150,10 @@ if __name__ == "__main__":
     for file_path, table_model in ORDER_IMPORT:
         load_tsv_to_db(file_path, table_model)
 
+    # bulk inserts bypass the model listeners: compute the derived columns
+    with engine.begin() as connection:
+        backfill_lastname_sort(connection)
+
     # add default user
     User.add_default_user(in_session=session)
     session.commit()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# /usr/bin/env python3
+"""
+Script to migrate an existing database to the current models
+without rebuilding it (new tables, columns, indexes and backfills).
+Each step is idempotent and can be run several times.
+"""
+
+import os
+import argparse
+
+from sqlalchemy import bindparam, create_engine, inspect, select, update, text
+from sqlalchemy.engine import Connection
+
+from api.config import BASE_DIR, settings
+from api.api_utils import normalize_sort_key
+from api.models.models import BASE, Person
+
+# indexes replaced by a newer definition
+OBSOLETE_INDEXES = ["ix_persons_lastname_sort_key"]
+
+
+def create_missing_tables(connection: Connection) -> None:
+    """Create the tables declared in the models that do not exist yet.
+
+    :param connection: The database connection to use.
+    :type connection: Connection
+    """
+    BASE.metadata.create_all(bind=connection, checkfirst=True)
+
+
+def drop_obsolete_indexes(connection: Connection) -> None:
+    """Drop the indexes that are no longer declared in the models.
+
+    :param connection: The database connection to use.
+    :type connection: Connection
+    """
+    for name in OBSOLETE_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def add_missing_columns(connection: Connection) -> None:
+    """Add the (nullable) columns declared in the models that do not exist yet.
+
+    :param connection: The database connection to use.
+    :type connection: Connection
+    """
+    inspector = inspect(connection)
+    for table in BASE.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                print(f"==> Adding column {column.name} on {table.name}.")
+                column_type = column.type.compile(dialect=connection.dialect)
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                    )
+                )
+
+
+def backfill_lastname_sort(connection: Connection) -> None:
+    """Compute the lastname sort key of persons where it is missing or stale.
+
+    :param connection: The database connection to use.
+    :type connection: Connection
+    """
+    rows = connection.execute(
+        select(Person.id, Person.lastname, Person.lastname_sort)
+    ).all()
+    params = [
+        {"_pk": row.id, "lastname_sort": normalize_sort_key(row.lastname)}
+        for row in rows
+        if row.lastname_sort != normalize_sort_key(row.lastname)
+    ]
+    if params:
+        connection.execute(
+            update(Person.__table__)
+            .where(Person.__table__.c.id == bindparam("_pk"))
+            .values(lastname_sort=bindparam("lastname_sort")),
+            params,
+        )
+    print(f"==> {len(params)} person sort keys updated.")
+
+
+def create_missing_indexes(connection: Connection) -> None:
+    """Create the indexes declared in the models that do not exist yet.
+
+    :param connection: The database connection to use.
+    :type connection: Connection
+    """
+    inspector = inspect(connection)
+    for table in BASE.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                print(f"==> Creating index {index.name} on {table.name}.")
+                index.create(bind=connection)
+
+
+MIGRATION_STEPS = [
+    create_missing_tables,
+    drop_obsolete_indexes,
+    add_missing_columns,
+    backfill_lastname_sort,
+    create_missing_indexes,
+]
+
+
+def migrate(db_path: str) -> None:
+    """Apply all migration steps on the database.
+
+    :param db_path: The path of the SQLite database to migrate.
+    :type db_path: str
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        for step in MIGRATION_STEPS:
+            print(f"==> {step.__name__}")
+            step(connection)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Migrate an existing database to the current models."
+    )
+    parser.add_argument(
+        "--db",
+        help="Database path and name",
+        default=os.path.join(BASE_DIR, settings.DB_URI),
+    )
+    args = parser.parse_args()
+    print(f"==> Database path: {args.db}")
+    migrate(args.db)
+    print("✔️ The database has been migrated.")
@@ -6,7 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 
-from api.database import get_db, BASE
+from api.database import get_db, get_read_db, BASE
 from api.main import app
 
 # from api.database_utils import populate_db_process
@@ -48,6 +48,7 @@ def override_get_db():
 
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 
 # populate database from last migration
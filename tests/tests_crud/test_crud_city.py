@@ -1,3 +1,4 @@
+from api.lookup_cache import city_lookup
 from api.models.models import City, Address
 from tests.conftest import local_session
 
@@ -37,3 +38,26 @@ def test_insee_code_uniqueness():
 
         assert session.query(City).filter_by(insee_fr_code="75056").count() == 1
         assert session.query(City).filter_by(insee_fr_code="69123").count() == 1
+
+
+def test_city_lookup_follows_commits():
+    """Verify that the city lookup is patched when cities are committed or deleted."""
+    with local_session as session:
+        city_lookup.load(session)
+        city = City(label="Rouen", insee_fr_department_label="Seine-Maritime")
+        session.add(city)
+        session.commit()
+
+        entry = city_lookup.get(None, city.id)
+        assert entry.id_dil == city._id_dil
+        assert city_lookup.get_by_id_dil(None, city._id_dil).label == "Rouen"
+
+        city.label = "Rouen (Seine-Inférieure)"
+        session.commit()
+        assert city_lookup.get(None, city.id).label == "Rouen (Seine-Inférieure)"
+
+        city_id, city_id_dil = city.id, city._id_dil
+        session.delete(city)
+        session.commit()
+        assert city_lookup.get(session, city_id) is None
+        assert city_lookup.get_by_id_dil(session, city_id_dil) is None
@@ -0,0 +1,66 @@
+from sqlalchemy import event
+
+from api.loaders import BatchLoader
+from api.models.models import Person, Patent
+from tests.conftest import local_session, engine, client
+
+
+def _create_printers(session, total: int) -> list:
+    """Create printers with two patents each."""
+    printers = [Person(lastname=f"Batch {i:02d}") for i in range(total)]
+    session.add_all(printers)
+    session.commit()
+    for printer in printers:
+        session.add_all(
+            [
+                Patent(person_id=printer.id, city_label="Lutèce", date_start="1830"),
+                Patent(person_id=printer.id, city_label="Lugdunum", date_start="1840"),
+            ]
+        )
+    session.commit()
+    return printers
+
+
+def test_batch_loader_groups_rows_by_key():
+    """Verify that the loader resolves all keys with a single query."""
+    with local_session as session:
+        printers = _create_printers(session, 3)
+        ids = [printer.id for printer in printers]
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            loader = BatchLoader(session)
+            patents = loader.load_many(
+                Patent.person_id, ids, order_by=(Patent.date_start.asc(),)
+            )
+            counts = loader.count_many(Patent.person_id, ids)
+            # already resolved keys are memoized
+            loader.get(Patent.person_id, ids[0])
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 2
+        assert [p.city_label for p in patents[ids[0]]] == ["Lutèce", "Lugdunum"]
+        assert counts == {pid: 2 for pid in ids}
+
+
+def test_read_printers_query_count_is_constant():
+    """Ensure the persons list route does not issue one query per printer."""
+    with local_session as session:
+        _create_printers(session, 12)
+
+    def count_statements(size: int) -> int:
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.get(f"/dil-db/api/persons?size={size}")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == size
+        return len(statements)
+
+    assert count_statements(2) == count_statements(10)
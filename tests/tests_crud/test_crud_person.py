@@ -1,7 +1,18 @@
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
-from api.models.models import Person
-from tests.conftest import local_session
+from api.crud import get_printer
+from api.lookup_cache import city_lookup
+from api.models.models import (
+    Person,
+    Patent,
+    City,
+    Address,
+    PersonHasAddresses,
+    PatentHasAddresses,
+    PatentHasRelations,
+)
+from tests.conftest import local_session, engine, TestingSessionLocal, client
 
 
 def test_create_person():
@@ -98,3 +109,139 @@ def test_before_update_markup_correction():
         session.commit()
 
         assert person.personal_information == "<br /><p>Mise à jour</p>"
+
+
+def test_lastname_sort_follows_lastname():
+    """Verify that the stored lastname sort key is accent-folded, lowercased and kept in sync."""
+    with local_session as session:
+        person = Person(lastname="Éverat-Lœillot", firstnames="Claude")
+        session.add(person)
+        session.commit()
+        assert person.lastname_sort == "everat-loeillot"
+
+        person.lastname = "Ébrard"
+        session.commit()
+        assert (
+            session.query(Person)
+            .filter(Person.lastname_sort == "ebrard", Person.firstnames == "Claude")
+            .count()
+            == 1
+        )
+
+
+def _create_printer_with_patents(session, lastname: str, total_patents: int) -> Person:
+    """Create a printer with patents, each one linked to a city, an address and a relation."""
+    city = City(label=f"Ville {lastname}")
+    address = Address(label=f"Rue {lastname}", city_label=city.label, city=city)
+    partner = Person(lastname=f"Associé {lastname}")
+    printer = Person(lastname=lastname, city=city)
+    session.add_all([city, address, partner, printer])
+    session.commit()
+    session.add(PersonHasAddresses(person_id=printer.id, address_id=address.id))
+    for i in range(total_patents):
+        patent = Patent(
+            person_id=printer.id, city_id=city.id, date_start=f"18{i + 10}-01-01"
+        )
+        session.add(patent)
+        session.commit()
+        session.add_all(
+            [
+                PatentHasAddresses(patent_id=patent.id, address_id=address.id),
+                PatentHasRelations(
+                    patent_id=patent.id,
+                    person_id=printer.id,
+                    person_related_id=partner.id,
+                    type="PARTNER",
+                ),
+            ]
+        )
+    session.commit()
+    return printer
+
+
+def _count_printer_detail_statements(id_dil: str) -> tuple[int, dict]:
+    """Count the SQL statements emitted to build an enhanced printer response."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    db = TestingSessionLocal()
+    city_lookup.load(db)
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        printer = get_printer(db, {"_id_dil": id_dil}, enhance=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+        db.close()
+    return len(statements), printer
+
+
+def test_get_printer_enhanced_statement_count():
+    """Ensure the printer detail payload is built in a fixed number of queries."""
+    with local_session as session:
+        small = _create_printer_with_patents(session, "Lemercier", total_patents=1)
+        large = _create_printer_with_patents(session, "Engelmann", total_patents=6)
+        small_id, large_id = small._id_dil, large._id_dil
+
+    small_count, small_printer = _count_printer_detail_statements(small_id)
+    large_count, large_printer = _count_printer_detail_statements(large_id)
+
+    assert len(small_printer["patents"]) == 1
+    assert len(large_printer["patents"]) == 6
+    assert large_printer["patents"][0]["city_id"] is not None
+    assert large_printer["patents"][0]["professional_addresses"][0]["city_id"]
+    assert large_printer["patents"][0]["patent_relations"][0]["type"] == "Associé"
+    assert large_printer["personal_addresses"][0]["city_id"] is not None
+    assert large_count == small_count
+    assert large_count <= 5
+
+
+def test_read_printers_cursor_pagination():
+    """Verify that keyset pagination walks persons in the same order as page numbers."""
+    with local_session as session:
+        session.add_all(
+            [Person(lastname=name) for name in ["Émond", "Eckert", "Èbre", "Abadie"]]
+        )
+        session.commit()
+
+    by_pages = client.get("/dil-db/api/persons?size=100").json()["items"]
+
+    seen, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = client.get(f"/dil-db/api/persons?size=3&cursor={cursor}")
+        assert response.status_code == 200
+        body = response.json()
+        seen.extend(item["_id_dil"] for item in body["items"])
+        cursor, pages = body["next_cursor"], pages + 1
+    assert seen == [item["_id_dil"] for item in by_pages]
+    assert pages == body["pages"]
+
+    # going back from the last page returns the three items before it
+    last_page_size = len(body["items"])
+    previous = client.get(f"/dil-db/api/persons?size=3&cursor={body['prev_cursor']}")
+    expected = seen[-last_page_size - 3 : -last_page_size]
+    assert [item["_id_dil"] for item in previous.json()["items"]] == expected
+
+    assert client.get("/dil-db/api/persons?cursor=invalid").status_code == 400
+
+
+def test_read_printer_detail_async_route():
+    """Ensure the async detail routes return the enhanced printer and its patents."""
+    with local_session as session:
+        printer = _create_printer_with_patents(session, "Senefelder", total_patents=2)
+        printer_id = printer._id_dil
+        patent_id = printer.patents[0]._id_dil
+
+    response = client.get(f"/dil-db/api/persons/person/{printer_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["lastname"] == "Senefelder"
+    assert len(body["patents"]) == 2
+
+    response = client.get(f"/dil-db/api/patents/patent/{patent_id}")
+    assert response.status_code == 200
+    assert response.json()["professional_addresses"][0]["city_id"] is not None
+
+    response = client.get("/dil-db/api/persons/person/person_dil_unknown")
+    assert response.status_code == 404
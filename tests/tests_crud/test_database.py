@@ -11,3 +11,21 @@ def test_get_db():
         next(db_gen)
     except StopIteration:
         pass
+
+
+def test_connection_profile():
+    """Test that the connection profile is applied and that the read engine rejects writes."""
+    import pytest
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from api.database import engine, read_engine
+
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA temp_store")).scalar() == 2
+
+    with read_engine.connect() as connection:
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("SELECT count(*) FROM persons")).scalar() >= 0
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("INSERT INTO persons (lastname) VALUES ('x')"))